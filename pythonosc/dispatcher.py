@@ -1,7 +1,9 @@
 """Maps OSC addresses to handler functions
 """
 
+import asyncio
 import collections
+import functools
 import inspect
 import logging
 import re
@@ -13,15 +15,94 @@ from typing import (
     Union,
     Any,
     AnyStr,
-    Generator,
     Tuple,
     Callable,
     Optional,
     DefaultDict,
+    Dict,
 )
 from pythonosc.osc_message import OscMessage
 from pythonosc.osc_message_builder import ArgValue
 
+_WILDCARD_RUN = re.compile(r"[*?]*\*[*?]*")
+
+# Converts an OSC address pattern into a regex in a single pass: characters
+# special to the re module are escaped like re.escape() does, except for the
+# OSC wildcards.
+# '?' in the OSC Address Pattern matches any single character.
+# Let's consider numbers and _ "characters" too here, it's not said
+# explicitly in the specification but it sounds good.
+# '*' in the OSC Address Pattern matches any sequence of zero or more
+# characters.
+_OSC_PATTERN_TO_REGEX = {
+    **{c: f"\\{chr(c)}" for c in b"()[]{}?*+-|^$\\.&~# \t\n\r\v\f"},
+    ord("?"): "\\w?",
+    ord("*"): "[\\w|\\+]*",
+}
+
+
+def _match_wildcards(address_pattern: str, address: str) -> bool:
+    """Returns whether an OSC address pattern matches the whole address.
+
+    Matches like the regex made by _OSC_PATTERN_TO_REGEX, but keeps the set of
+    pattern positions reachable after each character of the address instead of
+    backtracking, so it runs in O(len(address_pattern) * len(address)) whatever
+    the wildcards of the pattern.
+    """
+    end = len(address_pattern)
+
+    def skip_wildcards(positions: List[int]) -> List[int]:
+        # Wildcards can match an empty string, a position before one also
+        # stands for the position after it.
+        reached = []
+        seen = set()
+        for pos in positions:
+            while pos not in seen:
+                seen.add(pos)
+                reached.append(pos)
+                if pos == end or address_pattern[pos] not in "*?":
+                    break
+                pos += 1
+        return reached
+
+    positions = skip_wildcards([0])
+    for char in address:
+        is_word = char.isalnum() or char == "_"
+        next_positions = []
+        for pos in positions:
+            if pos == end:
+                continue
+            pattern_char = address_pattern[pos]
+            if pattern_char == "*":
+                if is_word or char in "|+":
+                    next_positions.append(pos)
+            elif pattern_char == "?":
+                if is_word:
+                    next_positions.append(pos + 1)
+            elif pattern_char == char:
+                next_positions.append(pos + 1)
+        if not next_positions:
+            return False
+        positions = skip_wildcards(next_positions)
+    return end in positions
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_osc_pattern(address_pattern: str) -> Callable[[str], Any]:
+    """Returns a function telling whether an OSC address pattern fully matches
+    an address.
+
+    Address patterns repeat heavily from one message to the next so the result
+    is cached, keeping the conversion and compilation off the dispatch path.
+    """
+    # A run of wildcards containing a '*' matches the same as a single '*'.
+    address_pattern = _WILDCARD_RUN.sub("*", address_pattern)
+    # A regex with several wildcards can backtrack exponentially, as with
+    # '*a*a*a*b', those patterns are matched in linear time instead.
+    if address_pattern.count("*") + address_pattern.count("?") > 1:
+        return functools.partial(_match_wildcards, address_pattern)
+    return re.compile(address_pattern.translate(_OSC_PATTERN_TO_REGEX)).fullmatch
+
 
 class Handler(object):
     """Wrapper for a callback function that will be called when an OSC message is sent to the right address.
@@ -31,6 +112,8 @@ class Handler(object):
     message if any were passed.
     """
 
+    __slots__ = ("callback", "args", "needs_reply_address", "_coroutine_check")
+
     def __init__(
         self,
         _callback: Callable,
@@ -46,6 +129,8 @@ class Handler(object):
         self.callback = _callback
         self.args = _args
         self.needs_reply_address = _needs_reply_address
+        # Callback last inspected along with whether it is a coroutine function.
+        self._coroutine_check = (_callback, inspect.iscoroutinefunction(_callback))
 
     # needed for test module
     def __eq__(self, other: Any) -> bool:
@@ -56,6 +141,18 @@ class Handler(object):
             and self.needs_reply_address == other.needs_reply_address
         )
 
+    def _callback_is_coroutine(self) -> bool:
+        """Returns whether the callback is a coroutine function.
+
+        Inspecting the callback costs several times more than calling it, so the
+        answer is kept until the callback is replaced.
+        """
+        callback, is_coroutine = self._coroutine_check
+        if callback is not self.callback:
+            is_coroutine = inspect.iscoroutinefunction(self.callback)
+            self._coroutine_check = (self.callback, is_coroutine)
+        return is_coroutine
+
     def invoke(
         self, client_address: Tuple[str, int], message: OscMessage
     ) -> Union[None, AnyStr, Tuple[AnyStr, ArgValue]]:
@@ -82,6 +179,24 @@ class Handler(object):
                 return self.callback(message.address, *message)
 
 
+class _AddressNode(object):
+    """Node of the tree indexing mapped addresses by their '/' separated parts.
+
+    Wildcards in an OSC address pattern never match across a '/', so a pattern
+    only has to be compared with the children of the nodes matched by its
+    previous part instead of with every mapped address.
+    """
+
+    __slots__ = ("children", "handlers", "order")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_AddressNode"] = {}
+        # Handlers of the address ending at this node, if one was mapped.
+        self.handlers: Optional[List[Handler]] = None
+        # Rank of that address in the mapping order.
+        self.order = 0
+
+
 class Dispatcher(object):
     """Maps Handlers to OSC addresses and dispatches messages to the handler on matched addresses
 
@@ -90,6 +205,18 @@ class Dispatcher(object):
 
     def __init__(self) -> None:
         self._map: DefaultDict[str, List[Handler]] = collections.defaultdict(list)
+        # Rank of each address in the order they were first mapped, handlers
+        # matching a pattern are returned following it.
+        self._address_order: Dict[str, int] = {}
+        # Mapped addresses containing a '*' wildcard, kept apart so that literal
+        # address patterns only have to be matched against these.
+        self._wildcard_addresses: List[str] = []
+        # Regexes of the mapped wildcard addresses along with the number of
+        # addresses they were built from, see _wildcard_address_regexes().
+        self._wildcard_regexes: Tuple[
+            int, Optional["re.Pattern[str]"], List[Tuple[str, "re.Pattern[str]"]]
+        ] = (0, None, [])
+        self._address_tree = _AddressNode()
         self._default_handler: Optional[Handler] = None
 
     def map(
@@ -130,6 +257,16 @@ class Dispatcher(object):
         # http://opensoundcontrol.org/spec-1_0
         # regarding multiple mappings
         handlerobj = Handler(handler, list(args), needs_reply_address)
+        if address not in self._map:
+            self._address_order[address] = len(self._address_order)
+            if "*" in address:
+                self._wildcard_addresses.append(address)
+            else:
+                node = self._address_tree
+                for part in address.split("/"):
+                    node = node.children.setdefault(part, _AddressNode())
+                node.handlers = self._map[address]
+                node.order = self._address_order[address]
         self._map[address].append(handlerobj)
         return handlerobj
 
@@ -167,9 +304,9 @@ class Dispatcher(object):
     def unmap(self, address, handler, *args, needs_reply_address=False):
         try:
             if isinstance(handler, Handler):
-                self._map[address].remove(handler)
+                self._map.get(address, []).remove(handler)
             else:
-                self._map[address].remove(
+                self._map.get(address, []).remove(
                     Handler(handler, list(args), needs_reply_address)
                 )
         except ValueError as e:
@@ -178,44 +315,102 @@ class Dispatcher(object):
                     f"Address '{address}' doesn't have handler '{handler}' mapped to it"
                 ) from e
 
-    def handlers_for_address(
-        self, address_pattern: str
-    ) -> Generator[Handler, None, None]:
-        """Yields handlers matching an address
+    def _wildcard_address_regexes(
+        self,
+    ) -> Tuple[Optional["re.Pattern[str]"], List[Tuple[str, "re.Pattern[str]"]]]:
+        """Returns the regexes of the mapped wildcard addresses.
+
+        The first one is the alternation of all of them, a single match of it
+        tells apart the common case where none of them matches. It is None if
+        no wildcard address was mapped. The list pairs each mapped wildcard
+        address with its own regex. They are compiled here, once after each
+        change, rather than on every dispatch.
+        """
+        regexes = self._wildcard_regexes
+        # Wildcard addresses are only ever added, so their count tells whether
+        # the regexes are current. The regexes are built from a copy of the
+        # list and stored as a single tuple along with its length, so an
+        # address mapped by another thread meanwhile just leaves them out of
+        # date until the next call.
+        if regexes[0] != len(self._wildcard_addresses):
+            addresses = self._wildcard_addresses[:]
+            patterns = [addr.replace("*", "[^/]*?/*") for addr in addresses]
+            regexes = (
+                len(addresses),
+                re.compile("|".join(f"(?:{pattern})" for pattern in patterns)),
+                [
+                    (addr, re.compile(pattern))
+                    for addr, pattern in zip(addresses, patterns)
+                ],
+            )
+            self._wildcard_regexes = regexes
+        return regexes[1], regexes[2]
+
+    def handlers_for_address(self, address_pattern: str) -> List[Handler]:
+        """Returns handlers matching an address
 
 
         Args:
             address_pattern: Address to match
 
         Returns:
-            Generator yielding Handlers matching address_pattern
+            List of Handlers matching address_pattern
         """
-        # First convert the address_pattern into a matchable regexp.
-        # '?' in the OSC Address Pattern matches any single character.
-        # Let's consider numbers and _ "characters" too here, it's not said
-        # explicitly in the specification but it sounds good.
-        escaped_address_pattern = re.escape(address_pattern)
-        pattern = escaped_address_pattern.replace("\\?", "\\w?")
-        # '*' in the OSC Address Pattern matches any sequence of zero or more
-        # characters.
-        pattern = pattern.replace("\\*", "[\\w|\\+]*")
-        # The rest of the syntax in the specification is like the re module so
-        # we're fine.
-        pattern = f"{pattern}$"
-        patterncompiled = re.compile(pattern)
-        matched = False
-
-        for addr, handlers in self._map.items():
-            if patterncompiled.match(addr) or (
-                ("*" in addr)
-                and re.match(addr.replace("*", "[^/]*?/*"), address_pattern)
-            ):
-                yield from handlers
-                matched = True
-
-        if not matched and self._default_handler:
+        handlers: List[Handler] = []
+        # Handler lists of the matched addresses along with their mapping rank.
+        matches: List[Tuple[int, List[Handler]]] = []
+
+        if "*" not in address_pattern and "?" not in address_pattern:
+            # Without wildcards the pattern can only match the very same
+            # address, or one of the mapped addresses containing wildcards.
+            if address_pattern in self._map:
+                matches.append(
+                    (self._address_order[address_pattern], self._map[address_pattern])
+                )
+            any_regex, address_regexes = self._wildcard_address_regexes()
+            if any_regex is not None and any_regex.match(address_pattern):
+                for addr, regex in address_regexes:
+                    if regex.match(address_pattern):
+                        matches.append((self._address_order[addr], self._map[addr]))
+        else:
+            # Walk down the tree of mapped addresses one part at a time.
+            nodes = [self._address_tree]
+            for part in address_pattern.split("/"):
+                if "*" not in part and "?" not in part:
+                    nodes = [
+                        node.children[part] for node in nodes if part in node.children
+                    ]
+                else:
+                    fullmatch = _compile_osc_pattern(part)
+                    nodes = [
+                        child
+                        for node in nodes
+                        for name, child in node.children.items()
+                        if fullmatch(name)
+                    ]
+                if not nodes:
+                    break
+            for node in nodes:
+                if node.handlers is not None:
+                    matches.append((node.order, node.handlers))
+
+            fullmatch = _compile_osc_pattern(address_pattern)
+            any_regex, address_regexes = self._wildcard_address_regexes()
+            any_matches = any_regex is not None and any_regex.match(address_pattern)
+            for addr, regex in address_regexes:
+                if fullmatch(addr) or (any_matches and regex.match(address_pattern)):
+                    matches.append((self._address_order[addr], self._map[addr]))
+
+        # Return the handlers in the order their addresses were mapped, the
+        # ranks are unique so the handler lists are never compared.
+        matches.sort()
+        for _, address_handlers in matches:
+            handlers.extend(address_handlers)
+
+        if not matches and self._default_handler:
             logging.debug("No handler matched but default handler present, added it.")
-            yield self._default_handler
+            handlers.append(self._default_handler)
+        return handlers
 
     def call_handlers_for_packet(
         self, data: bytes, client_address: Tuple[str, int]
@@ -233,20 +428,34 @@ class Dispatcher(object):
         # Get OSC messages from all bundles or standalone message.
         try:
             packet = osc_packet.OscPacket(data)
-            for timed_msg in packet.messages:
-                now = time.time()
-                handlers = self.handlers_for_address(timed_msg.message.address)
-                if not handlers:
-                    continue
-                # If the message is to be handled later, then so be it.
-                if timed_msg.time > now:
-                    time.sleep(timed_msg.time - now)
-                for handler in handlers:
-                    result = handler.invoke(client_address, timed_msg.message)
-                    if result is not None:
-                        results.append(result)
         except osc_packet.ParseError:
-            pass
+            return []
+        now = time.time()
+        # Bundles often hold several messages for the same address, only
+        # look its handlers up once per packet.
+        handlers_by_address: Dict[str, List[Handler]] = {}
+        for timed_msg in packet.messages:
+            address = timed_msg.message.address
+            handlers = handlers_by_address.get(address)
+            if handlers is None:
+                handlers = self.handlers_for_address(address)
+                handlers_by_address[address] = handlers
+            if not handlers:
+                continue
+            # A message due before the last clock reading is due now too,
+            # only read the clock again for the ones that may be ahead.
+            if timed_msg.time > now:
+                now = time.time()
+            # If the message is to be handled later, then so be it.
+            if timed_msg.time > now:
+                time.sleep(timed_msg.time - now)
+                # Messages are sorted by time, the ones sharing this time are
+                # then handled right away without another sleep.
+                now = timed_msg.time
+            for handler in handlers:
+                result = handler.invoke(client_address, timed_msg.message)
+                if result is not None:
+                    results.append(result)
         return results
 
     async def async_call_handlers_for_packet(
@@ -270,55 +479,70 @@ class Dispatcher(object):
         results = []
         try:
             packet = osc_packet.OscPacket(data)
-            for timed_msg in packet.messages:
+        except osc_packet.ParseError:
+            return []
+        now = time.time()
+        # Bundles often hold several messages for the same address, only
+        # look its handlers up once per packet.
+        handlers_by_address: Dict[str, List[Handler]] = {}
+        for timed_msg in packet.messages:
+            address = timed_msg.message.address
+            handlers = handlers_by_address.get(address)
+            if handlers is None:
+                handlers = self.handlers_for_address(address)
+                handlers_by_address[address] = handlers
+            if not handlers:
+                continue
+            # A message due before the last clock reading is due now too,
+            # only read the clock again for the ones that may be ahead.
+            if timed_msg.time > now:
                 now = time.time()
-                handlers = self.handlers_for_address(timed_msg.message.address)
-                if not handlers:
-                    continue
-                # If the message is to be handled later, then so be it.
-                if timed_msg.time > now:
-                    time.sleep(timed_msg.time - now)
-                for handler in handlers:
-                    if inspect.iscoroutinefunction(handler.callback):
-                        if handler.needs_reply_address:
-                            result = await handler.callback(
-                                client_address,
-                                timed_msg.message.address,
-                                handler.args,
-                                *timed_msg.message,
-                            )
-                        elif handler.args:
-                            result = await handler.callback(
-                                timed_msg.message.address,
-                                handler.args,
-                                *timed_msg.message,
-                            )
-                        else:
-                            result = await handler.callback(
-                                timed_msg.message.address, *timed_msg.message
-                            )
+            # If the message is to be handled later, then so be it, without
+            # blocking the event loop in the meantime.
+            if timed_msg.time > now:
+                await asyncio.sleep(timed_msg.time - now)
+                # Messages are sorted by time, the ones sharing this time are
+                # then handled right away without another sleep.
+                now = timed_msg.time
+            for handler in handlers:
+                if handler._callback_is_coroutine():
+                    if handler.needs_reply_address:
+                        result = await handler.callback(
+                            client_address,
+                            timed_msg.message.address,
+                            handler.args,
+                            *timed_msg.message,
+                        )
+                    elif handler.args:
+                        result = await handler.callback(
+                            timed_msg.message.address,
+                            handler.args,
+                            *timed_msg.message,
+                        )
+                    else:
+                        result = await handler.callback(
+                            timed_msg.message.address, *timed_msg.message
+                        )
+                else:
+                    if handler.needs_reply_address:
+                        result = handler.callback(
+                            client_address,
+                            timed_msg.message.address,
+                            handler.args,
+                            *timed_msg.message,
+                        )
+                    elif handler.args:
+                        result = handler.callback(
+                            timed_msg.message.address,
+                            handler.args,
+                            *timed_msg.message,
+                        )
                     else:
-                        if handler.needs_reply_address:
-                            result = handler.callback(
-                                client_address,
-                                timed_msg.message.address,
-                                handler.args,
-                                *timed_msg.message,
-                            )
-                        elif handler.args:
-                            result = handler.callback(
-                                timed_msg.message.address,
-                                handler.args,
-                                *timed_msg.message,
-                            )
-                        else:
-                            result = handler.callback(
-                                timed_msg.message.address, *timed_msg.message
-                            )
-                    if result:
-                        results.append(result)
-        except osc_packet.ParseError as e:
-            pass
+                        result = handler.callback(
+                            timed_msg.message.address, *timed_msg.message
+                        )
+                if result:
+                    results.append(result)
         return results
 
     def set_default_handler(
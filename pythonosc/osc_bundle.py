@@ -18,6 +18,8 @@ class OscBundle(object):
     An element can be another OscBundle or an OscMessage.
     """
 
+    __slots__ = ("_dgram", "_timestamp", "_contents")
+
     def __init__(self, dgram: bytes) -> None:
         """Initializes the OscBundle with the given datagram.
 
@@ -37,31 +39,53 @@ class OscBundle(object):
         # Get the contents as a list of OscBundle and OscMessage.
         self._contents = self._parse_contents(index)
 
+    @classmethod
+    def _from_contents(
+        cls,
+        dgram: bytes,
+        timestamp: float,
+        contents: List[Union["OscBundle", osc_message.OscMessage]],
+    ) -> "OscBundle":
+        """Returns a bundle made of already parsed contents without parsing dgram.
+
+        Args:
+          dgram: the UDP datagram of the bundle made of these contents.
+          timestamp: the timestamp as read back from the datagram.
+          contents: the elements of the bundle, in the datagram order.
+        """
+        bundle = cls.__new__(cls)
+        bundle._dgram = dgram
+        bundle._timestamp = timestamp
+        bundle._contents = contents
+        return bundle
+
     def _parse_contents(
         self, index: int
     ) -> List[Union["OscBundle", osc_message.OscMessage]]:
         contents = []  # type: List[Union[OscBundle, osc_message.OscMessage]]
+        dgram = self._dgram
 
         try:
             # An OSC Bundle Element consists of its size and its contents.
             # The size is an int32 representing the number of 8-bit bytes in the
             # contents, and will always be a multiple of 4. The contents are either
             # an OSC Message or an OSC Bundle.
-            while self._dgram[index:]:
+            while index < len(dgram):
                 # Get the sub content size.
-                content_size, index = osc_types.get_int(self._dgram, index)
+                content_size, index = osc_types.get_int(dgram, index)
                 # Get the datagram for the sub content.
-                content_dgram = self._dgram[index : index + content_size]
+                content_dgram = dgram[index : index + content_size]
                 # Increment our position index up to the next possible content.
                 index += content_size
-                # Parse the content into an OSC message or bundle.
-                if OscBundle.dgram_is_bundle(content_dgram):
-                    contents.append(OscBundle(content_dgram))
-                elif osc_message.OscMessage.dgram_is_message(content_dgram):
+                # Parse the content into an OSC message or bundle, messages
+                # being the most common content they are checked for first.
+                if osc_message.OscMessage.dgram_is_message(content_dgram):
                     contents.append(osc_message.OscMessage(content_dgram))
+                elif OscBundle.dgram_is_bundle(content_dgram):
+                    contents.append(OscBundle(content_dgram))
                 else:
                     logging.warning(
-                        f"Could not identify content type of dgram {content_dgram!r}"
+                        "Could not identify content type of dgram %r", content_dgram
                     )
         except (osc_types.ParseError, osc_message.ParseError, IndexError) as e:
             raise ParseError(f"Could not parse a content datagram: {e}")
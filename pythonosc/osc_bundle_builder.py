@@ -9,6 +9,9 @@ from pythonosc.parsing import osc_types
 # Shortcut to specify an immediate execution of messages in the bundle.
 IMMEDIATELY = osc_types.IMMEDIATELY
 
+# Types of the contents a bundle can hold.
+_CONTENT_TYPES = (osc_message.OscMessage, osc_bundle.OscBundle)
+
 
 class BuildError(Exception):
     """Error raised when an error occurs building the bundle."""
@@ -41,20 +44,24 @@ class OscBundleBuilder(object):
         Raises:
           - BuildError: if we could not build the bundle.
         """
-        dgram = b"#bundle\x00"
         try:
-            dgram += osc_types.write_date(self._timestamp)
+            date = osc_types.write_date(self._timestamp)
+            # The parts are joined with a single copy at the end.
+            parts = [b"#bundle\x00", date]
             for content in self._contents:
-                if isinstance(content, osc_message.OscMessage) or isinstance(
-                    content, osc_bundle.OscBundle
-                ):
+                if isinstance(content, _CONTENT_TYPES):
                     size = content.size
-                    dgram += osc_types.write_int(size)
-                    dgram += content.dgram
+                    parts.append(osc_types.write_int(size))
+                    parts.append(content.dgram)
                 else:
                     raise BuildError(
                         f"Content must be either OscBundle or OscMessage, found {type(content)}"
                     )
-            return osc_bundle.OscBundle(dgram)
+            # The contents are already parsed, only the timestamp is read back
+            # so that it matches what a receiver would get from the datagram.
+            timestamp, _ = osc_types.get_date(date, 0)
+            return osc_bundle.OscBundle._from_contents(
+                b"".join(parts), timestamp, list(self._contents)
+            )
         except osc_types.BuildError as be:
             raise BuildError(f"Could not build the bundle {be}")
@@ -1,9 +1,40 @@
 """Representation of an OSC message in a pythonesque way."""
 
+import functools
 import logging
+import struct
 
 from pythonosc.parsing import osc_types
-from typing import List, Iterator, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Functions reading the value of each argument type from a datagram.
+_PARAM_PARSERS: Dict[str, Callable[[bytes, int], Tuple[Any, int]]] = {
+    "i": osc_types.get_int,  # Integer.
+    "h": osc_types.get_int64,  # Int64.
+    "f": osc_types.get_float,  # Float.
+    "d": osc_types.get_double,  # Double.
+    "s": osc_types.get_string,  # String.
+    "b": osc_types.get_blob,  # Blob.
+    "r": osc_types.get_rgba,  # RGBA.
+    "m": osc_types.get_midi,  # MIDI.
+    "t": osc_types.get_timetag,  # osc time tag.
+}
+
+# struct format characters of the argument types having a fixed size.
+_FIXED_SIZE_PARAM_FORMATS = {"i": "i", "h": "q", "f": "f", "d": "d"}
+
+
+@functools.lru_cache(maxsize=256)
+def _fixed_size_params_struct(type_tag: str) -> Optional[struct.Struct]:
+    """Returns a Struct decoding all the arguments of a type tag at once.
+
+    Returns None if any of the arguments is not a plain number of fixed size.
+    """
+    try:
+        formats = "".join(_FIXED_SIZE_PARAM_FORMATS[param] for param in type_tag)
+    except KeyError:
+        return None
+    return struct.Struct(">" + formats)
 
 
 class ParseError(Exception):
@@ -17,10 +48,26 @@ class OscMessage(object):
     Type Tag String followed by zero or more OSC Arguments.
     """
 
+    __slots__ = ("_dgram", "_parameters", "_address_regexp", "_unparsed")
+
     def __init__(self, dgram: bytes) -> None:
         self._dgram = dgram
         self._parameters = []  # type: List[Any]
         self._parse_datagram()
+        self._unparsed = False
+
+    @classmethod
+    def _from_built_dgram(cls, dgram: bytes) -> "OscMessage":
+        """Returns a message for a datagram known to be valid, parsed lazily.
+
+        Messages made by OscMessageBuilder are mostly just sent, so their address
+        and arguments are only parsed back from the datagram when first read.
+        """
+        message = cls.__new__(cls)
+        message._dgram = dgram
+        message._parameters = []
+        message._unparsed = True
+        return message
 
     def __str__(self):
         return f"{self.address} {' '.join(str(p) for p in self.params)}"
@@ -28,7 +75,7 @@ class OscMessage(object):
     def _parse_datagram(self) -> None:
         try:
             self._address_regexp, index = osc_types.get_string(self._dgram, 0)
-            if not self._dgram[index:]:
+            if index >= len(self._dgram):
                 # No params is legit, just return now.
                 return
 
@@ -37,29 +84,27 @@ class OscMessage(object):
             if type_tag.startswith(","):
                 type_tag = type_tag[1:]
 
+            # Messages made only of numbers are decoded in a single call.
+            params_struct = _fixed_size_params_struct(type_tag)
+            if (
+                params_struct is not None
+                and len(self._dgram) - index >= params_struct.size
+            ):
+                self._parameters = list(params_struct.unpack_from(self._dgram, index))
+                return
+
+            dgram = self._dgram
+            get_parser = _PARAM_PARSERS.get
             params = []  # type: List[Any]
             param_stack = [params]
+            # The innermost array being parsed, values are appended to it.
+            current = params
             # Parse each parameter given its type.
             for param in type_tag:
                 val = NotImplemented  # type: Any
-                if param == "i":  # Integer.
-                    val, index = osc_types.get_int(self._dgram, index)
-                elif param == "h":  # Int64.
-                    val, index = osc_types.get_int64(self._dgram, index)
-                elif param == "f":  # Float.
-                    val, index = osc_types.get_float(self._dgram, index)
-                elif param == "d":  # Double.
-                    val, index = osc_types.get_double(self._dgram, index)
-                elif param == "s":  # String.
-                    val, index = osc_types.get_string(self._dgram, index)
-                elif param == "b":  # Blob.
-                    val, index = osc_types.get_blob(self._dgram, index)
-                elif param == "r":  # RGBA.
-                    val, index = osc_types.get_rgba(self._dgram, index)
-                elif param == "m":  # MIDI.
-                    val, index = osc_types.get_midi(self._dgram, index)
-                elif param == "t":  # osc time tag:
-                    val, index = osc_types.get_timetag(self._dgram, index)
+                parser = get_parser(param)
+                if parser is not None:
+                    val, index = parser(dgram, index)
                 elif param == "T":  # True.
                     val = True
                 elif param == "F":  # False.
@@ -68,20 +113,23 @@ class OscMessage(object):
                     val = None
                 elif param == "[":  # Array start.
                     array = []  # type: List[Any]
-                    param_stack[-1].append(array)
+                    current.append(array)
                     param_stack.append(array)
+                    current = array
+                    continue
                 elif param == "]":  # Array stop.
                     if len(param_stack) < 2:
                         raise ParseError(
                             f"Unexpected closing bracket in type tag: {type_tag}"
                         )
                     param_stack.pop()
+                    current = param_stack[-1]
+                    continue
                 # TODO: Support more exotic types as described in the specification.
                 else:
-                    logging.warning(f"Unhandled parameter type: {param}")
+                    logging.warning("Unhandled parameter type: %s", param)
                     continue
-                if param not in "[]":
-                    param_stack[-1].append(val)
+                current.append(val)
             if len(param_stack) != 1:
                 raise ParseError(f"Missing closing bracket in type tag: {type_tag}")
             self._parameters = params
@@ -91,12 +139,15 @@ class OscMessage(object):
     @property
     def address(self) -> str:
         """Returns the OSC address regular expression."""
+        if self._unparsed:
+            self._parse_datagram()
+            self._unparsed = False
         return self._address_regexp
 
     @staticmethod
     def dgram_is_message(dgram: bytes) -> bool:
         """Returns whether this datagram starts as an OSC message."""
-        return dgram.startswith(b"/")
+        return dgram[:1] == b"/"
 
     @property
     def size(self) -> int:
@@ -115,4 +166,7 @@ class OscMessage(object):
 
     def __iter__(self) -> Iterator[Any]:
         """Returns an iterator over the parameters of this message."""
+        if self._unparsed:
+            self._parse_datagram()
+            self._unparsed = False
         return iter(self._parameters)
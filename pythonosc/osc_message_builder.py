@@ -1,12 +1,42 @@
 """Build OSC messages for client applications."""
 
-from typing import Any, Iterable, List, Optional, Tuple, Union
+import functools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from pythonosc import osc_message
 from pythonosc.parsing import osc_types
 
 ArgValue = Union[str, bytes, bool, int, float, osc_types.MidiPacket, list]
 
+# Type tag string of messages without arguments.
+_EMPTY_TYPE_TAG = osc_types.write_string(",")
+
+# Argument types of values whose exact class is enough to tell their type.
+_ARG_TYPES_BY_CLASS: Dict[type, str] = {
+    str: "s",
+    bytes: "b",
+    float: "f",
+    type(None): "N",
+}
+
+# Functions writing the datagram of each argument type carrying a value.
+_ARG_WRITERS: Dict[str, Callable[[Any], bytes]] = {
+    "s": osc_types.write_string,  # String.
+    "i": osc_types.write_int,  # Integer.
+    "h": osc_types.write_int64,  # Int64.
+    "f": osc_types.write_float,  # Float.
+    "d": osc_types.write_double,  # Double.
+    "b": osc_types.write_blob,  # Blob.
+    "r": osc_types.write_rgba,  # RGBA.
+    "m": osc_types.write_midi,  # MIDI.
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _address_only_dgram(address: str) -> bytes:
+    """Returns the datagram of a message without arguments sent to address."""
+    return osc_types.write_string(address) + _EMPTY_TYPE_TAG
+
 
 class BuildError(Exception):
     """Error raised when an incomplete message is trying to be built."""
@@ -43,6 +73,8 @@ class OscMessageBuilder(object):
         ARG_TYPE_FALSE,
         ARG_TYPE_NIL,
     )
+    # Set of the types above, for constant time membership checks.
+    _SUPPORTED_ARG_TYPES_SET = frozenset(_SUPPORTED_ARG_TYPES)
 
     def __init__(self, address: Optional[str] = None) -> None:
         """Initialize a new builder for a message.
@@ -69,14 +101,16 @@ class OscMessageBuilder(object):
         return self._args
 
     def _valid_type(self, arg_type: str) -> bool:
-        if arg_type in self._SUPPORTED_ARG_TYPES:
-            return True
-        elif isinstance(arg_type, list):
+        if isinstance(arg_type, list):
             for sub_type in arg_type:
                 if not self._valid_type(sub_type):
                     return False
             return True
-        return False
+        # Unhashable values can't be a type tag.
+        try:
+            return arg_type in self._SUPPORTED_ARG_TYPES_SET
+        except TypeError:
+            return False
 
     def add_arg(self, arg_value: ArgValue, arg_type: Optional[str] = None) -> None:
         """Add a typed argument to this message.
@@ -112,6 +146,11 @@ class OscMessageBuilder(object):
         Raises:
           - ValueError: if the type is not supported.
         """
+        # Look the most common classes up directly, subclasses go through the
+        # isinstance checks below.
+        class_arg_type = _ARG_TYPES_BY_CLASS.get(type(arg_value))
+        if class_arg_type is not None:
+            return class_arg_type
         if isinstance(arg_value, str):
             arg_type = self.ARG_TYPE_STRING  # type: Union[str, Any]
         elif isinstance(arg_value, bytes):
@@ -149,46 +188,35 @@ class OscMessageBuilder(object):
         """
         if not self._address:
             raise BuildError("OSC addresses cannot be empty")
-        dgram = b""
         try:
-            # Write the address.
-            dgram += osc_types.write_string(self._address)
+            # Messages without arguments, such as pings, are often sent over and
+            # over to the same addresses.
             if not self._args:
-                dgram += osc_types.write_string(",")
-                return osc_message.OscMessage(dgram)
+                return osc_message.OscMessage._from_built_dgram(
+                    _address_only_dgram(self._address)
+                )
+
+            # Write the address.
+            address = osc_types.write_string(self._address)
 
-            # Write the parameters.
+            # Write the parameters, the parts are joined with a single copy at
+            # the end.
             arg_types = "".join([arg[0] for arg in self._args])
-            dgram += osc_types.write_string(f",{arg_types}")
+            parts = [address, osc_types.write_string(f",{arg_types}")]
             for arg_type, value in self._args:
-                if arg_type == self.ARG_TYPE_STRING:
-                    dgram += osc_types.write_string(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_INT:
-                    dgram += osc_types.write_int(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_INT64:
-                    dgram += osc_types.write_int64(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_FLOAT:
-                    dgram += osc_types.write_float(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_DOUBLE:
-                    dgram += osc_types.write_double(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_BLOB:
-                    dgram += osc_types.write_blob(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_RGBA:
-                    dgram += osc_types.write_rgba(value)  # type: ignore[arg-type]
-                elif arg_type == self.ARG_TYPE_MIDI:
-                    dgram += osc_types.write_midi(value)  # type: ignore[arg-type]
-                elif arg_type in (
+                writer = _ARG_WRITERS.get(arg_type)
+                if writer is not None:
+                    parts.append(writer(value))
+                elif arg_type not in (
                     self.ARG_TYPE_TRUE,
                     self.ARG_TYPE_FALSE,
                     self.ARG_TYPE_ARRAY_START,
                     self.ARG_TYPE_ARRAY_STOP,
                     self.ARG_TYPE_NIL,
                 ):
-                    continue
-                else:
                     raise BuildError(f"Incorrect parameter type found {arg_type}")
 
-            return osc_message.OscMessage(dgram)
+            return osc_message.OscMessage._from_built_dgram(b"".join(parts))
         except osc_types.BuildError as be:
             raise BuildError(f"Could not build the message: {be}")
 
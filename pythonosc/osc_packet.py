@@ -3,6 +3,7 @@
 It lets you access easily to OscMessage and OscBundle instances in the packet.
 """
 
+import operator
 import time
 
 from pythonosc.parsing import osc_types
@@ -23,20 +24,34 @@ TimedMessage = NamedTuple(
     ],
 )
 
+# Sort key of TimedMessage, its time field.
+_MESSAGE_TIME = operator.itemgetter(0)
+
+
+def _bundle_time(bundle: osc_bundle.OscBundle, now: float) -> float:
+    """Returns the time at which the messages of a bundle should be executed."""
+    if bundle.timestamp == osc_types.IMMEDIATELY or bundle.timestamp < now:
+        return now
+    return bundle.timestamp
+
 
 def _timed_msg_of_bundle(
-    bundle: osc_bundle.OscBundle, now: float
+    bundle: osc_bundle.OscBundle, now: float, msgs: List[TimedMessage]
 ) -> List[TimedMessage]:
-    """Returns messages contained in nested bundles as a list of TimedMessage."""
-    msgs = []
-    for content in bundle:
-        if type(content) is osc_message.OscMessage:
-            if bundle.timestamp == osc_types.IMMEDIATELY or bundle.timestamp < now:
-                msgs.append(TimedMessage(now, content))
+    """Appends messages contained in nested bundles to msgs as TimedMessage."""
+    # Nested bundles are walked depth first with an explicit stack of
+    # (execution time, contents iterator) so messages keep their order.
+    stack = [(_bundle_time(bundle, now), iter(bundle))]
+    while stack:
+        msg_time, contents = stack[-1]
+        for content in contents:
+            if type(content) is osc_message.OscMessage:
+                msgs.append(TimedMessage(msg_time, content))
             else:
-                msgs.append(TimedMessage(bundle.timestamp, content))
+                stack.append((_bundle_time(content, now), iter(content)))
+                break
         else:
-            msgs.extend(_timed_msg_of_bundle(content, now))
+            stack.pop()
     return msgs
 
 
@@ -62,13 +77,14 @@ class OscPacket(object):
         """
         now = time.time()
         try:
-            if osc_bundle.OscBundle.dgram_is_bundle(dgram):
-                self._messages = sorted(
-                    _timed_msg_of_bundle(osc_bundle.OscBundle(dgram), now),
-                    key=lambda x: x.time,
-                )
-            elif osc_message.OscMessage.dgram_is_message(dgram):
+            # Most packets hold a single message, check for those first.
+            if osc_message.OscMessage.dgram_is_message(dgram):
                 self._messages = [TimedMessage(now, osc_message.OscMessage(dgram))]
+            elif osc_bundle.OscBundle.dgram_is_bundle(dgram):
+                msgs = _timed_msg_of_bundle(osc_bundle.OscBundle(dgram), now, [])
+                if len(msgs) > 1:
+                    msgs.sort(key=_MESSAGE_TIME)
+                self._messages = msgs
             else:
                 # Empty packet, should not happen as per the spec but heh, UDP...
                 raise ParseError(
@@ -51,9 +51,10 @@ def _is_valid_request(request: _RequestType) -> bool:
         request, tuple
     )  # TODO: handle requests which are passed just as a socket?
     data = request[0]
-    return osc_bundle.OscBundle.dgram_is_bundle(
+    # Most datagrams hold a single message, check for those first.
+    return osc_message.OscMessage.dgram_is_message(
         data
-    ) or osc_message.OscMessage.dgram_is_message(data)
+    ) or osc_bundle.OscBundle.dgram_is_bundle(data)
 
 
 class OSCUDPServer(socketserver.UDPServer):
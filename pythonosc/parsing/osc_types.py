@@ -31,7 +31,16 @@ _TIMETAG_DGRAM_LEN = 8
 # Strings and blob dgram length is always a multiple of 4 bytes.
 _STRING_DGRAM_PAD = 4
 _BLOB_DGRAM_PAD = 4
-_EMPTY_STR_DGRAM = b"\x00\x00\x00\x00"
+
+# Precompiled structs for the fixed size types, saving the format string
+# parsing of struct.pack() and struct.unpack() and the slicing of the
+# datagram on every call.
+_INT_STRUCT = struct.Struct(">i")
+_INT64_STRUCT = struct.Struct(">q")
+_UINT64_STRUCT = struct.Struct(">Q")
+_UINT_STRUCT = struct.Struct(">I")
+_FLOAT_STRUCT = struct.Struct(">f")
+_DOUBLE_STRUCT = struct.Struct(">d")
 
 
 def write_string(val: str) -> bytes:
@@ -69,30 +78,21 @@ def get_string(dgram: bytes, start_index: int) -> Tuple[str, int]:
     """
     if start_index < 0:
         raise ParseError("start_index < 0")
-    offset = 0
     try:
-        if (
-            len(dgram) > start_index + _STRING_DGRAM_PAD
-            and dgram[start_index + _STRING_DGRAM_PAD] == _EMPTY_STR_DGRAM
-        ):
-            return "", start_index + _STRING_DGRAM_PAD
-        while dgram[start_index + offset] != 0:
-            offset += 1
-        # Align to a byte word.
-        if (offset) % _STRING_DGRAM_PAD == 0:
-            offset += _STRING_DGRAM_PAD
-        else:
-            offset += -offset % _STRING_DGRAM_PAD
-        # Python slices do not raise an IndexError past the last index,
-        # do it ourselves.
-        if offset > len(dgram[start_index:]):
-            raise ParseError("Datagram is too short")
-        data_str = dgram[start_index : start_index + offset]
-        return data_str.replace(b"\x00", b"").decode("utf-8"), start_index + offset
-    except IndexError as ie:
-        raise ParseError(f"Could not parse datagram {ie}")
-    except TypeError as te:
+        # bytes.index scans for the terminating null in C.
+        null_index = dgram.index(b"\x00", start_index)
+    except ValueError:
+        raise ParseError("String is not null-terminated")
+    except (AttributeError, TypeError) as te:
         raise ParseError(f"Could not parse datagram {te}")
+    # Align to a byte word, there is always 1 to 4 bytes of null padding.
+    offset = (null_index - start_index + _STRING_DGRAM_PAD) & ~(_STRING_DGRAM_PAD - 1)
+    # Python slices do not raise an IndexError past the last index,
+    # do it ourselves.
+    if offset > len(dgram) - start_index:
+        raise ParseError("Datagram is too short")
+    # The string ends at the first null, the rest of the word is padding.
+    return dgram[start_index:null_index].decode("utf-8"), start_index + offset
 
 
 def write_int(val: int) -> bytes:
@@ -102,7 +102,7 @@ def write_int(val: int) -> bytes:
       - BuildError if the int could not be converted.
     """
     try:
-        return struct.pack(">i", val)
+        return _INT_STRUCT.pack(val)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -121,10 +121,12 @@ def get_int(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
         return (
-            struct.unpack(">i", dgram[start_index : start_index + _INT_DGRAM_LEN])[0],
+            _INT_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _INT_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -138,7 +140,7 @@ def write_int64(val: int) -> bytes:
       - BuildError if the int64 could not be converted.
     """
     try:
-        return struct.pack(">q", val)
+        return _INT64_STRUCT.pack(val)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -157,10 +159,12 @@ def get_int64(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT64_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _INT64_DGRAM_LEN:
             raise ParseError("Datagram is too short")
         return (
-            struct.unpack(">q", dgram[start_index : start_index + _INT64_DGRAM_LEN])[0],
+            _INT64_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _INT64_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -181,12 +185,12 @@ def get_uint64(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _UINT64_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _UINT64_DGRAM_LEN:
             raise ParseError("Datagram is too short")
         return (
-            struct.unpack(">Q", dgram[start_index : start_index + _UINT64_DGRAM_LEN])[
-                0
-            ],
+            _UINT64_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _UINT64_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -208,7 +212,9 @@ def get_timetag(dgram: bytes, start_index: int) -> Tuple[Tuple[datetime, int], i
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _TIMETAG_DGRAM_LEN:
             raise ParseError("Datagram is too short")
 
         timetag, _ = get_uint64(dgram, start_index)
@@ -233,7 +239,7 @@ def write_float(val: float) -> bytes:
       - BuildError if the float could not be converted.
     """
     try:
-        return struct.pack(">f", val)
+        return _FLOAT_STRUCT.pack(val)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -252,13 +258,16 @@ def get_float(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _FLOAT_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _FLOAT_DGRAM_LEN:
             # Noticed that Reaktor doesn't send the last bunch of \x00 needed to make
             # the float representation complete in some cases, thus we pad here to
             # account for that.
-            dgram = dgram + b"\x00" * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
+            remaining = max(len(dgram) - start_index, 0)
+            dgram = dgram + b"\x00" * (_FLOAT_DGRAM_LEN - remaining)
         return (
-            struct.unpack(">f", dgram[start_index : start_index + _FLOAT_DGRAM_LEN])[0],
+            _FLOAT_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _FLOAT_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -272,7 +281,7 @@ def write_double(val: float) -> bytes:
       - BuildError if the double could not be converted.
     """
     try:
-        return struct.pack(">d", val)
+        return _DOUBLE_STRUCT.pack(val)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -291,12 +300,12 @@ def get_double(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _DOUBLE_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _DOUBLE_DGRAM_LEN:
             raise ParseError("Datagram is too short")
         return (
-            struct.unpack(">d", dgram[start_index : start_index + _DOUBLE_DGRAM_LEN])[
-                0
-            ],
+            _DOUBLE_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _DOUBLE_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -322,10 +331,12 @@ def get_blob(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
       ParseError if the datagram could not be parsed.
     """
     size, int_offset = get_int(dgram, start_index)
+    if size < 0:
+        raise ParseError("Blob size is negative")
     # Make the size a multiple of 32 bits.
-    total_size = size + (-size % _BLOB_DGRAM_PAD)
+    total_size = (size + _BLOB_DGRAM_PAD - 1) & ~(_BLOB_DGRAM_PAD - 1)
     end_index = int_offset + size
-    if end_index - start_index > len(dgram[start_index:]):
+    if end_index > len(dgram):
         raise ParseError("Datagram is too short.")
     return dgram[int_offset : int_offset + size], int_offset + total_size
 
@@ -367,7 +378,7 @@ def get_date(dgram: bytes, start_index: int) -> Tuple[float, int]:
     # Check for the special case first.
     if dgram[start_index : start_index + _TIMETAG_DGRAM_LEN] == ntp.IMMEDIATELY:
         return IMMEDIATELY, start_index + _TIMETAG_DGRAM_LEN
-    if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
+    if len(dgram) - start_index < _TIMETAG_DGRAM_LEN:
         raise ParseError("Datagram is too short")
     timetag, start_index = get_uint64(dgram, start_index)
     seconds = timetag * ntp._NTP_TIMESTAMP_TO_SECONDS
@@ -391,7 +402,7 @@ def write_rgba(val: bytes) -> bytes:
       - BuildError if the int could not be converted.
     """
     try:
-        return struct.pack(">I", val)
+        return _UINT_STRUCT.pack(val)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -410,10 +421,12 @@ def get_rgba(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
         return (
-            struct.unpack(">I", dgram[start_index : start_index + _INT_DGRAM_LEN])[0],
+            _UINT_STRUCT.unpack_from(dgram, start_index)[0],
             start_index + _INT_DGRAM_LEN,
         )
     except (struct.error, TypeError) as e:
@@ -433,7 +446,7 @@ def write_midi(val: MidiPacket) -> bytes:
         raise BuildError("MIDI message length is invalid")
     try:
         value = sum((value & 0xFF) << 8 * (3 - pos) for pos, value in enumerate(val))
-        return struct.pack(">I", value)
+        return _UINT_STRUCT.pack(value)
     except struct.error as e:
         raise BuildError(f"Wrong argument value passed: {e}")
 
@@ -452,9 +465,11 @@ def get_midi(dgram: bytes, start_index: int) -> Tuple[MidiPacket, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if start_index < 0:
+            raise ParseError("start_index < 0")
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        val = struct.unpack(">I", dgram[start_index : start_index + _INT_DGRAM_LEN])[0]
+        val = _UINT_STRUCT.unpack_from(dgram, start_index)[0]
         midi_msg = cast(
             MidiPacket, tuple((val & 0xFF << 8 * i) >> 8 * i for i in range(3, -1, -1))
         )
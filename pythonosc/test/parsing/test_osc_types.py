@@ -16,6 +16,7 @@ class TestString(unittest.TestCase):
             b"ABC\x00": ("ABC", 4),
             b"ABCD\x00\x00\x00\x00": ("ABCD", 8),
             b"ABCD\x00\x00\x00\x00GARBAGE": ("ABCD", 8),
+            b"A\x00BC": ("A", 4),
             b"\x00\x00\x00\x00": ("", 4),
         }
 
@@ -306,6 +307,11 @@ class TestBlob(unittest.TestCase):
             osc_types.ParseError, osc_types.get_blob, b"\x00\x00\x00\x00", -1
         )
 
+    def test_get_blob_raises_on_negative_size(self):
+        self.assertRaises(
+            osc_types.ParseError, osc_types.get_blob, b"\xff\xff\xff\xfc\x00", 0
+        )
+
 
 class TestNTPTimestamp(unittest.TestCase):
     def test_immediately_dgram(self):
@@ -1,5 +1,9 @@
+import re
+import time
 import unittest
+from unittest import mock
 
+from pythonosc import osc_bundle_builder, osc_message_builder
 from pythonosc.dispatcher import Dispatcher, Handler
 
 
@@ -98,6 +102,31 @@ class TestDispatcher(unittest.TestCase):
             [Handler(1, [])], self.dispatcher.handlers_for_address("/foo*/bar*/*")
         )
 
+    def test_match_repeated_wildcards(self):
+        self.dispatcher.map("/foo/" + "a" * 30, 1)
+
+        self.sortAndAssertSequenceEqual(
+            [Handler(1, [])], self.dispatcher.handlers_for_address("/foo/a**?*a")
+        )
+        self.sortAndAssertSequenceEqual(
+            [], self.dispatcher.handlers_for_address("/foo/" + "*?" * 30 + "b")
+        )
+
+    def test_match_interleaved_wildcards(self):
+        self.dispatcher.map("/foo/" + "a" * 30, 1)
+        self.dispatcher.map("/bar*", 2)
+
+        self.sortAndAssertSequenceEqual(
+            [Handler(1, [])], self.dispatcher.handlers_for_address("/foo/*a?a*a")
+        )
+        # These would take ages with a backtracking regex.
+        self.sortAndAssertSequenceEqual(
+            [], self.dispatcher.handlers_for_address("/foo/" + "*a" * 30 + "b")
+        )
+        self.sortAndAssertSequenceEqual(
+            [], self.dispatcher.handlers_for_address("/*a" * 30 + "b")
+        )
+
     def test_call_correct_dispatcher_on_star(self):
         self.dispatcher.map("/a+b", 1)
         self.dispatcher.map("/aaab", 2)
@@ -145,6 +174,44 @@ class TestDispatcher(unittest.TestCase):
             self.dispatcher.handlers_for_address("/foo/bar"),
         )
 
+    def test_literal_address_handlers_in_mapping_order(self):
+        self.dispatcher.map("/*", 1)
+        self.dispatcher.map("/a", 2)
+        self.dispatcher.map("/a*", 3)
+        self.assertSequenceEqual(
+            [Handler(1, []), Handler(2, []), Handler(3, [])],
+            self.dispatcher.handlers_for_address("/a"),
+        )
+
+    def test_wildcard_pattern_handlers_in_mapping_order(self):
+        self.dispatcher.map("/x/1", 1)
+        self.dispatcher.map("/y/1", 2)
+        self.dispatcher.map("/*", 3)
+        self.dispatcher.map("/x/2", 4)
+        self.assertSequenceEqual(
+            [Handler(1, []), Handler(2, []), Handler(3, []), Handler(4, [])],
+            self.dispatcher.handlers_for_address("/*/?"),
+        )
+
+    def test_wildcard_address_mapped_while_compiling_regexes(self):
+        self.dispatcher.map("/a*", 1)
+        compile_regex = re.compile
+
+        def map_while_compiling(*args):
+            # Stands for another server thread mapping an address meanwhile.
+            if not self.dispatcher._map.get("/b*"):
+                self.dispatcher.map("/b*", 2)
+            return compile_regex(*args)
+
+        with mock.patch(
+            "pythonosc.dispatcher.re.compile", side_effect=map_while_compiling
+        ):
+            self.dispatcher.handlers_for_address("/a")
+
+        self.sortAndAssertSequenceEqual(
+            [Handler(2, [])], self.dispatcher.handlers_for_address("/b")
+        )
+
     def test_unmap(self):
         def dummyhandler():
             pass
@@ -181,6 +248,97 @@ class TestDispatcher(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.dispatcher.unmap("/unmap/exception", handlerobj)
 
+    def test_failed_unmap_does_not_hide_default_handler(self):
+        def dummyhandler():
+            pass
+
+        self.dispatcher.set_default_handler(dummyhandler)
+        with self.assertRaises(ValueError):
+            self.dispatcher.unmap("/unmap/exception", dummyhandler)
+
+        self.sortAndAssertSequenceEqual(
+            [Handler(dummyhandler, [])],
+            self.dispatcher.handlers_for_address("/unmap/exception"),
+        )
+
+    def test_handlers_looked_up_once_per_address_in_bundle(self):
+        handler = mock.Mock(return_value=None)
+        self.dispatcher.map("/test", handler)
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for value in range(3):
+            msg = osc_message_builder.OscMessageBuilder("/test")
+            msg.add_arg(value)
+            bundle.add_content(msg.build())
+
+        with mock.patch.object(
+            self.dispatcher,
+            "handlers_for_address",
+            wraps=self.dispatcher.handlers_for_address,
+        ) as handlers_for_address:
+            self.dispatcher.call_handlers_for_packet(
+                bundle.build().dgram, ("127.0.0.1", 8000)
+            )
+
+        handlers_for_address.assert_called_once_with("/test")
+        handler.assert_has_calls(
+            [mock.call("/test", 0), mock.call("/test", 1), mock.call("/test", 2)]
+        )
+
+    @mock.patch("pythonosc.dispatcher.time.sleep")
+    def test_sleeps_once_for_messages_sharing_a_time(self, mock_sleep):
+        handler = mock.Mock(return_value=None)
+        self.dispatcher.map("/test", handler)
+        bundle = osc_bundle_builder.OscBundleBuilder(time.time() + 10)
+        for value in range(3):
+            msg = osc_message_builder.OscMessageBuilder("/test")
+            msg.add_arg(value)
+            bundle.add_content(msg.build())
+
+        self.dispatcher.call_handlers_for_packet(
+            bundle.build().dgram, ("127.0.0.1", 8000)
+        )
+
+        mock_sleep.assert_called_once()
+        self.assertEqual(3, handler.call_count)
+
+
+class TestAsyncDispatcher(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = Dispatcher()
+
+    @mock.patch("pythonosc.dispatcher.time.sleep")
+    @mock.patch("pythonosc.dispatcher.asyncio.sleep", new_callable=mock.AsyncMock)
+    async def test_future_message_does_not_block_event_loop(
+        self, mock_async_sleep, mock_sleep
+    ):
+        handler = mock.Mock(return_value=None)
+        self.dispatcher.map("/test", handler)
+        bundle = osc_bundle_builder.OscBundleBuilder(time.time() + 10)
+        bundle.add_content(osc_message_builder.OscMessageBuilder("/test").build())
+
+        await self.dispatcher.async_call_handlers_for_packet(
+            bundle.build().dgram, ("127.0.0.1", 8000)
+        )
+
+        mock_async_sleep.assert_awaited_once()
+        mock_sleep.assert_not_called()
+        handler.assert_called_once_with("/test")
+
+    async def test_replaced_callback_is_awaited(self):
+        handler = mock.Mock(return_value=None)
+        async_handler = mock.AsyncMock(return_value=None)
+        self.dispatcher.map("/test", handler)
+        dgram = osc_message_builder.OscMessageBuilder("/test").build().dgram
+
+        await self.dispatcher.async_call_handlers_for_packet(dgram, ("127.0.0.1", 8000))
+        for mapped in self.dispatcher.handlers_for_address("/test"):
+            mapped.callback = async_handler
+        await self.dispatcher.async_call_handlers_for_packet(dgram, ("127.0.0.1", 8000))
+
+        handler.assert_called_once_with("/test")
+        async_handler.assert_awaited_once_with("/test")
+
 
 if __name__ == "__main__":
     unittest.main()
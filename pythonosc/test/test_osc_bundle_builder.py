@@ -1,5 +1,6 @@
 import unittest
 
+from pythonosc import osc_bundle
 from pythonosc import osc_bundle_builder
 from pythonosc import osc_message_builder
 
@@ -40,6 +41,23 @@ class TestOscBundleBuilder(unittest.TestCase):
         bundle = bundle.build()
         self.assertEqual(5, bundle.num_contents)
 
+    def test_build_matches_parsed_bundle(self):
+        builder = osc_bundle_builder.OscBundleBuilder(1234567.89)
+        msg = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        msg.add_arg(4.0)
+        builder.add_content(msg.build())
+        builder.add_content(
+            osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY).build()
+        )
+
+        bundle = builder.build()
+        parsed = osc_bundle.OscBundle(bundle.dgram)
+        self.assertEqual(parsed.timestamp, bundle.timestamp)
+        self.assertEqual(parsed.num_contents, bundle.num_contents)
+        for built_content, parsed_content in zip(bundle, parsed):
+            self.assertEqual(type(parsed_content), type(built_content))
+            self.assertEqual(parsed_content.dgram, built_content.dgram)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,15 @@ _DGRAM_ALL_STANDARD_TYPES_OF_PARAMS = (
     b"\x00\x00\x00\x08stuff\x00\x00\x00"
 )  # b"stuff\x00\x00\x00"
 
+_DGRAM_FIXED_SIZE_NUMBERS = (
+    b"/SYNC\x00\x00\x00"
+    b",ihfd\x00\x00\x00"
+    b"\xff\xff\xff\xfd"  # -3
+    b"\x00\x00\x00\xe8\xd4\xa5\x10\x00"  # 1000000000000
+    b"@\x00\x00\x00"  # 2.0
+    b"?\xe0\x00\x00\x00\x00\x00\x00"  # 0.5
+)
+
 _DGRAM_ALL_NON_STANDARD_TYPES_OF_PARAMS = (
     b"/SYNC\x00\x00\x00"
     b"T"  # True
@@ -89,6 +98,13 @@ class TestOscMessage(unittest.TestCase):
         self.assertEqual(b"stuff\x00\x00\x00", msg.params[3])
         self.assertEqual(4, len(list(msg)))
 
+    def test_fixed_size_number_params(self):
+        msg = osc_message.OscMessage(_DGRAM_FIXED_SIZE_NUMBERS)
+        self.assertEqual("/SYNC", msg.address)
+        self.assertEqual([-3, 1000000000000, 2.0, 0.5], msg.params)
+        self.assertTrue(isinstance(msg.params[0], int))
+        self.assertTrue(isinstance(msg.params[2], float))
+
     def test_all_non_standard_params(self):
         msg = osc_message.OscMessage(_DGRAM_ALL_NON_STANDARD_TYPES_OF_PARAMS)
 
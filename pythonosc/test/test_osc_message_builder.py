@@ -1,5 +1,6 @@
 import unittest
 
+from pythonosc import osc_message
 from pythonosc import osc_message_builder
 
 
@@ -11,6 +12,15 @@ class TestOscMessageBuilder(unittest.TestCase):
         # Messages with just an address should still contain the ",".
         self.assertEqual(b"/a/b/c\x00\x00,\x00\x00\x00", msg.dgram)
 
+    def test_build_matches_parsed_message(self):
+        builder = osc_message_builder.OscMessageBuilder("/a/b/c")
+        builder.add_arg(0.1)
+        builder.add_arg([1, "abc"])
+        msg = builder.build()
+        parsed = osc_message.OscMessage(msg.dgram)
+        self.assertEqual(parsed.address, msg.address)
+        self.assertEqual(parsed.params, msg.params)
+
     def test_no_address_raises(self):
         builder = osc_message_builder.OscMessageBuilder("")
         self.assertRaises(osc_message_builder.BuildError, builder.build)
@@ -18,6 +28,8 @@ class TestOscMessageBuilder(unittest.TestCase):
     def test_wrong_param_raise(self):
         builder = osc_message_builder.OscMessageBuilder("")
         self.assertRaises(ValueError, builder.add_arg, "what?", 1)
+        self.assertRaises(ValueError, builder.add_arg, "what?", {"s": "f"})
+        self.assertRaises(ValueError, builder.add_arg, ["what?"], ["s", {"s"}])
 
     def test_add_arg_invalid_infered_type(self):
         builder = osc_message_builder.OscMessageBuilder("")
@@ -89,6 +101,14 @@ class TestOscMessageBuilder(unittest.TestCase):
         reference = bytearray.fromhex("2f53594e430000002c000000")
         self.assertSequenceEqual(msg._dgram, reference)
 
+    def test_build_honours_changes_to_args(self):
+        builder = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        builder.add_arg(1)
+        builder.args.append(("f", 2.0))
+        self.assertEqual([1, 2.0], builder.build().params)
+        builder.args.clear()
+        self.assertEqual([], builder.build().params)
+
     def test_bool_encoding(self):
         builder = osc_message_builder.OscMessageBuilder("")
         builder.add_arg(0)
@@ -97,6 +117,18 @@ class TestOscMessageBuilder(unittest.TestCase):
         builder.add_arg(True)
         self.assertEqual(builder.args, [("i", 0), ("i", 1), ("F", False), ("T", True)])
 
+    def test_subclass_type_inference(self):
+        class Text(str):
+            pass
+
+        class Number(float):
+            pass
+
+        builder = osc_message_builder.OscMessageBuilder("")
+        builder.add_arg(Text("a"))
+        builder.add_arg(Number(1.5))
+        self.assertEqual(builder.args, [("s", "a"), ("f", 1.5)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -58,6 +58,13 @@ class TestOscPacket(unittest.TestCase):
         packet = osc_packet.OscPacket(_DGRAM_TWO_MESSAGES_IN_BUNDLE)
         self.assertEqual(2, len(packet.messages))
 
+    def test_messages_are_timed_messages(self):
+        packet = osc_packet.OscPacket(_DGRAM_TWO_MESSAGES_IN_BUNDLE)
+        for timed_msg in packet.messages:
+            self.assertIsInstance(timed_msg, osc_packet.TimedMessage)
+            self.assertEqual((timed_msg.time, timed_msg.message), tuple(timed_msg))
+            self.assertEqual("/SYNC", timed_msg.message.address)
+
     def test_empty_dgram_raises_exception(self):
         self.assertRaises(osc_packet.ParseError, osc_packet.OscPacket, b"")
 
@@ -72,6 +79,13 @@ class TestOscPacket(unittest.TestCase):
         self.assertTrue(packet.messages[1][0], packet.messages[2][0])
         self.assertTrue(packet.messages[2][0], packet.messages[3][0])
 
+    def test_nested_mess_bundle_keeps_message_order(self):
+        packet = osc_packet.OscPacket(_DGRAM_NESTED_MESS)
+        self.assertEqual(
+            ["/1111", "/2222", "/3333", "/4444"],
+            [timed_msg.message.address for timed_msg in packet.messages],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()